@@ -5,7 +5,10 @@ This file contains configurable parameters for the analysis engine.
 """
 
 import os
-from typing import Dict, Any
+import re
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 # AI Model Configuration
 AI_CONFIG = {
@@ -26,8 +29,8 @@ ANALYSIS_CONFIG = {
     "enable_claim_consistency_check": True,
 }
 
-# Numerical Data Patterns
-NUMERICAL_PATTERNS = {
+# Numerical Data Patterns (raw sources, kept for introspection)
+NUMERICAL_PATTERNS_RAW = {
     "currency": [
         r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)([MBK]?)',  # $2M, $3M, etc.
         r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*([MBK]?)\s*dollars?',  # 2M dollars
@@ -59,6 +62,31 @@ NUMERICAL_PATTERNS = {
     ],
 }
 
+# Maps each named group in the fused patterns back to its category
+NUMERICAL_GROUP_KIND: Dict[str, str] = {
+    f"{category}_{index}": category
+    for category, patterns in NUMERICAL_PATTERNS_RAW.items()
+    for index in range(len(patterns))
+}
+
+def _fuse(category: str, patterns) -> "re.Pattern":
+    """Fuse a category's patterns into one alternation of named groups."""
+    return re.compile(
+        "|".join(f"(?P<{category}_{index}>{pattern})" for index, pattern in enumerate(patterns)),
+        re.IGNORECASE,
+    )
+
+def _build_numerical_patterns() -> Dict[str, "re.Pattern"]:
+    """Compile one pattern per category.
+
+    A single finditer() pass over the text yields every match, and
+    NUMERICAL_GROUP_KIND[m.lastgroup] gives its category.
+    """
+    return {
+        category: _fuse(category, patterns)
+        for category, patterns in NUMERICAL_PATTERNS_RAW.items()
+    }
+
 # Key Claims Keywords
 KEY_CLAIMS_KEYWORDS = [
     "AI-powered", "automated", "faster", "efficient", "streamlined",
@@ -69,44 +97,65 @@ KEY_CLAIMS_KEYWORDS = [
     "sustainable", "eco-friendly", "green", "environmental",
 ]
 
-# Inconsistency Types
-INCONSISTENCY_TYPES = {
-    "numerical_conflict": {
-        "description": "Conflicting numerical values across slides",
-        "severity": "high",
-        "confidence_threshold": 0.9,
-    },
-    "performance_claim_conflict": {
-        "description": "Conflicting performance improvement claims",
-        "severity": "high",
-        "confidence_threshold": 0.85,
-    },
-    "financial_data_mismatch": {
-        "description": "Inconsistent financial figures or metrics",
-        "severity": "high",
-        "confidence_threshold": 0.9,
-    },
-    "timeline_conflict": {
-        "description": "Conflicting dates, timelines, or forecasts",
-        "severity": "medium",
-        "confidence_threshold": 0.8,
-    },
-    "brand_inconsistency": {
-        "description": "Inconsistent brand or product information",
-        "severity": "medium",
-        "confidence_threshold": 0.8,
-    },
-    "claim_contradiction": {
-        "description": "Contradictory statements or claims",
-        "severity": "medium",
-        "confidence_threshold": 0.75,
-    },
-    "mathematical_error": {
-        "description": "Mathematical inconsistencies or calculation errors",
-        "severity": "high",
-        "confidence_threshold": 0.95,
-    },
-}
+def _build_inconsistency_types() -> Dict[str, Dict[str, Any]]:
+    """Build the inconsistency type catalogue.
+
+    Type names and severities are interned since report code groups and
+    sorts on them repeatedly.
+    """
+    types = {
+        "numerical_conflict": {
+            "description": "Conflicting numerical values across slides",
+            "severity": "high",
+            "confidence_threshold": 0.9,
+        },
+        "performance_claim_conflict": {
+            "description": "Conflicting performance improvement claims",
+            "severity": "high",
+            "confidence_threshold": 0.85,
+        },
+        "financial_data_mismatch": {
+            "description": "Inconsistent financial figures or metrics",
+            "severity": "high",
+            "confidence_threshold": 0.9,
+        },
+        "timeline_conflict": {
+            "description": "Conflicting dates, timelines, or forecasts",
+            "severity": "medium",
+            "confidence_threshold": 0.8,
+        },
+        "brand_inconsistency": {
+            "description": "Inconsistent brand or product information",
+            "severity": "medium",
+            "confidence_threshold": 0.8,
+        },
+        "claim_contradiction": {
+            "description": "Contradictory statements or claims",
+            "severity": "medium",
+            "confidence_threshold": 0.75,
+        },
+        "mathematical_error": {
+            "description": "Mathematical inconsistencies or calculation errors",
+            "severity": "high",
+            "confidence_threshold": 0.95,
+        },
+    }
+    return {
+        sys.intern(name): {**spec, "severity": sys.intern(spec["severity"])}
+        for name, spec in types.items()
+    }
+
+# Severity ranks, most severe first
+_SEV_RANK = {"high": 0, "medium": 1, "low": 2}
+
+def _build_inconsistency_type_order() -> Mapping[str, int]:
+    """Rank inconsistency types by severity so reports can sort on ints.
+
+    The ranking is derived data, so it is handed out read-only.
+    """
+    types = _lazy("INCONSISTENCY_TYPES")
+    ranked = sorted(types, key=lambda name: _SEV_RANK[types[name]["severity"]])
+    return MappingProxyType({name: rank for rank, name in enumerate(ranked)})
 
 # Output Configuration
 OUTPUT_CONFIG = {
@@ -142,9 +191,9 @@ def get_config() -> Dict[str, Any]:
     return {
         "ai": AI_CONFIG,
         "analysis": ANALYSIS_CONFIG,
-        "numerical_patterns": NUMERICAL_PATTERNS,
+        "numerical_patterns": _lazy("NUMERICAL_PATTERNS"),
         "key_claims_keywords": KEY_CLAIMS_KEYWORDS,
-        "inconsistency_types": INCONSISTENCY_TYPES,
+        "inconsistency_types": _lazy("INCONSISTENCY_TYPES"),
         "output": OUTPUT_CONFIG,
         "logging": LOGGING_CONFIG,
         "performance": PERFORMANCE_CONFIG,
@@ -164,48 +213,59 @@ def get_output_config() -> Dict[str, Any]:
 
 def update_config(key: str, value: Any) -> None:
     """Update a configuration value."""
-    if key in globals():
+    if key in globals() or key in _LAZY_BUILDERS:
         globals()[key] = value
+        if key == "INCONSISTENCY_TYPES":
+            # Re-rank from the new catalogue on next access
+            globals().pop("INCONSISTENCY_TYPE_ORDER", None)
     else:
         raise ValueError(f"Configuration key '{key}' not found")
 
+# (section, key) pairs that must be present for the config to be usable
+_REQUIRED_SCHEMA = (
+    ("ai", "model_name"),
+    ("analysis", "min_confidence_threshold"),
+    ("output", "supported_formats"),
+)
+
 def validate_config() -> bool:
     """Validate the configuration for consistency."""
     try:
-        # Check required fields
-        required_fields = ["ai", "analysis", "output"]
         config = get_config()
-        
-        for field in required_fields:
-            if field not in config:
-                print(f"❌ Missing required configuration field: {field}")
-                return False
-        
-        # Validate AI config
-        ai_config = config["ai"]
-        if "model_name" not in ai_config:
-            print("❌ Missing AI model name in configuration")
-            return False
-        
-        # Validate analysis config
-        analysis_config = config["analysis"]
-        if "min_confidence_threshold" not in analysis_config:
-            print("❌ Missing confidence threshold in analysis configuration")
-            return False
-        
-        # Validate output config
-        output_config = config["output"]
-        if "supported_formats" not in output_config:
-            print("❌ Missing supported formats in output configuration")
+        missing = [
+            f"{section}.{key}"
+            for section, key in _REQUIRED_SCHEMA
+            if key not in config.get(section, {})
+        ]
+        if missing:
+            print(f"❌ Missing required configuration fields: {', '.join(missing)}")
             return False
-        
+
         print("✅ Configuration validation passed")
         return True
-        
+
     except Exception as e:
         print(f"❌ Configuration validation failed: {e}")
         return False
 
+# Heavy sections are built on first access (PEP 562) rather than at import
+_LAZY_BUILDERS = {
+    "NUMERICAL_PATTERNS": _build_numerical_patterns,
+    "INCONSISTENCY_TYPES": _build_inconsistency_types,
+    "INCONSISTENCY_TYPE_ORDER": _build_inconsistency_type_order,
+}
+
+def _lazy(name: str) -> Any:
+    """Return a lazily-built section, building and storing it on first use."""
+    if name not in globals():
+        globals()[name] = _LAZY_BUILDERS[name]()
+    return globals()[name]
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_BUILDERS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 if __name__ == "__main__":
     # Test configuration
     print("🔧 Testing PowerPoint Inconsistency Detector Configuration")
@@ -8,12 +8,13 @@ and showing the inconsistencies found.
 
 import os
 import sys
-from dotenv import load_dotenv
+from collections import defaultdict
+from pathlib import Path
 
 # Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from ppt_inspector import PowerPointInspector, ContentExtractor, AIAnalyzer, ReportGenerator
+_here = str(Path(__file__).parent)
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
 def run_demo():
     """Run the main demo."""
@@ -22,6 +23,11 @@ def run_demo():
     print("This demo will analyze the sample slides and show inconsistencies found.")
     print()
     
+    # Heavy dependencies are imported here so declining the demo stays fast
+    from dotenv import load_dotenv
+    from ppt_inspector import PowerPointInspector
+    from config import INCONSISTENCY_TYPE_ORDER
+    
     # Check for API key
     load_dotenv()
     api_key = os.getenv("GEMINI_API_KEY")
@@ -55,27 +61,33 @@ def run_demo():
             print()
             
             # Group by type for better organization
-            by_type = {}
+            by_type = defaultdict(list)
             for inc in inconsistencies:
-                inc_type = inc.inconsistency_type
-                if inc_type not in by_type:
-                    by_type[inc_type] = []
-                by_type[inc_type].append(inc)
+                by_type[inc.inconsistency_type].append(inc)
             
-            # Display findings
+            # Most severe types first; types unknown to config go last
+            unranked = len(INCONSISTENCY_TYPE_ORDER)
+            by_type = dict(sorted(
+                by_type.items(),
+                key=lambda kv: INCONSISTENCY_TYPE_ORDER.get(kv[0], unranked)
+            ))
+            
+            # Display findings (buffered and written once)
+            lines = []
             for inc_type, incs in by_type.items():
-                print(f"📋 {inc_type.upper()} ({len(incs)} issues):")
-                print("-" * 40)
+                lines.append(f"📋 {inc_type.upper()} ({len(incs)} issues):")
+                lines.append("-" * 40)
                 
                 for i, inc in enumerate(incs, 1):
-                    print(f"\n{i}. {inc.description}")
-                    print(f"   📍 Slides: {', '.join(map(str, inc.slide_numbers))}")
-                    print(f"   🎯 Confidence: {inc.confidence:.1%}")
-                    print(f"   📝 Evidence:")
+                    lines.append(f"\n{i}. {inc.description}")
+                    lines.append(f"   📍 Slides: {', '.join(map(str, inc.slide_numbers))}")
+                    lines.append(f"   🎯 Confidence: {inc.confidence:.1%}")
+                    lines.append(f"   📝 Evidence:")
                     for evidence in inc.evidence:
-                        print(f"      • {evidence}")
-                    print(f"   💡 Recommendation: {inc.recommendation}")
-                    print()
+                        lines.append(f"      • {evidence}")
+                    lines.append(f"   💡 Recommendation: {inc.recommendation}")
+                    lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
         
         # Generate reports
         print("\n📊 Generating detailed reports...")
@@ -84,14 +96,14 @@ def run_demo():
         inspector.report_generator.generate_report(
             inconsistencies,
             output_format="json",
-            output_file="demo_analysis_report.json"
+            output="demo_analysis_report.json"
         )
         
         # CSV report
         inspector.report_generator.generate_report(
             inconsistencies,
             output_format="csv",
-            output_file="demo_analysis_report.csv"
+            output="demo_analysis_report.csv"
         )
         
         print("\n✅ Demo completed successfully!")
@@ -109,25 +121,28 @@ def run_demo():
 
 def show_sample_slides_summary():
     """Show a summary of what the sample slides contain."""
-    print("\n📋 SAMPLE SLIDES SUMMARY")
-    print("=" * 40)
-    print("The demo will analyze these sample slides:")
-    print()
-    print("Slide 1: Case Study - Noogat helps consultants make decks 2x faster using AI")
-    print("   • Claims: 2x faster, $2M saved, 15 mins per slide")
-    print()
-    print("Slide 2: Noogat Helps Consultants Make Decks Faster Using AI")
-    print("   • Claims: 3x faster, $3M saved, 20 mins per slide")
-    print()
-    print("Slide 3: Noogat: 50 Hours Saved Per Consultant Monthly")
-    print("   • Claims: 50 hours total, but breakdown shows 40 hours (10+12+8+6+4)")
-    print()
-    print("Expected inconsistencies:")
-    print("   • Performance claims: 2x vs 3x faster")
-    print("   • Financial data: $2M vs $3M saved")
-    print("   • Time savings: 15 mins vs 20 mins per slide")
-    print("   • Mathematical error: 50 hours claimed vs 40 hours calculated")
-    print()
+    lines = [
+        "\n📋 SAMPLE SLIDES SUMMARY",
+        "=" * 40,
+        "The demo will analyze these sample slides:",
+        "",
+        "Slide 1: Case Study - Noogat helps consultants make decks 2x faster using AI",
+        "   • Claims: 2x faster, $2M saved, 15 mins per slide",
+        "",
+        "Slide 2: Noogat Helps Consultants Make Decks Faster Using AI",
+        "   • Claims: 3x faster, $3M saved, 20 mins per slide",
+        "",
+        "Slide 3: Noogat: 50 Hours Saved Per Consultant Monthly",
+        "   • Claims: 50 hours total, but breakdown shows 40 hours (10+12+8+6+4)",
+        "",
+        "Expected inconsistencies:",
+        "   • Performance claims: 2x vs 3x faster",
+        "   • Financial data: $2M vs $3M saved",
+        "   • Time savings: 15 mins vs 20 mins per slide",
+        "   • Mathematical error: 50 hours claimed vs 40 hours calculated",
+        "",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main demo function."""
@@ -16,33 +16,30 @@ sys.path.append(str(Path(__file__).parent))
 from ppt_inspector import PowerPointInspector
 from config import get_config
 
-def example_basic_usage():
+def example_basic_usage(inspector, inconsistencies):
     """Demonstrate basic usage of the PowerPoint Inspector."""
     print("🔍 PowerPoint Inspector - Basic Usage Example")
     print("=" * 50)
     
-    # Initialize the inspector
-    inspector = PowerPointInspector()
-    
     # Example 1: Analyze a PowerPoint file (if available)
     pptx_file = "sample_presentation.pptx"
     if os.path.exists(pptx_file):
         print(f"\n📊 Analyzing PowerPoint file: {pptx_file}")
         try:
-            inconsistencies = inspector.analyze_presentation(file_path=pptx_file)
-            print(f"Found {len(inconsistencies)} inconsistencies")
+            file_inconsistencies = inspector.analyze_presentation(file_path=pptx_file)
+            print(f"Found {len(file_inconsistencies)} inconsistencies")
             
             # Generate different output formats
             inspector.report_generator.generate_report(
-                inconsistencies, 
+                file_inconsistencies, 
                 output_format="console"
             )
             
             # Save as JSON
             inspector.report_generator.generate_report(
-                inconsistencies, 
+                file_inconsistencies, 
                 output_format="json", 
-                output_file="inconsistencies.json"
+                output="inconsistencies.json"
             )
             
         except Exception as e:
@@ -50,20 +47,15 @@ def example_basic_usage():
     else:
         print(f"\n⚠️  PowerPoint file '{pptx_file}' not found")
     
-    # Example 2: Analyze sample slides (built-in demo)
+    # Example 2: Sample slides (built-in demo), analyzed once in main()
     print(f"\n📊 Analyzing sample slides (built-in demo)")
-    try:
-        inconsistencies = inspector.analyze_presentation()
-        print(f"Found {len(inconsistencies)} inconsistencies in sample slides")
-        
-        # Show first few inconsistencies
-        for i, inc in enumerate(inconsistencies[:3]):
-            print(f"\n{i+1}. {inc.type}: {inc.description}")
-            print(f"   Slides: {inc.slides_involved}")
-            print(f"   Confidence: {inc.confidence}")
-            
-    except Exception as e:
-        print(f"Error analyzing sample slides: {e}")
+    print(f"Found {len(inconsistencies)} inconsistencies in sample slides")
+    
+    # Show first few inconsistencies
+    for i, inc in enumerate(inconsistencies[:3]):
+        print(f"\n{i+1}. {inc.type}: {inc.description}")
+        print(f"   Slides: {inc.slides_involved}")
+        print(f"   Confidence: {inc.confidence}")
 
 def example_custom_analysis():
     """Demonstrate custom analysis configuration."""
@@ -85,16 +77,11 @@ def example_custom_analysis():
     print(f"Enable AI Analysis: {analysis_config.get('ENABLE_AI_ANALYSIS', 'Not set')}")
     print(f"Enable Rule-based Checks: {analysis_config.get('ENABLE_RULE_BASED_CHECKS', 'Not set')}")
 
-def example_output_formats():
+def example_output_formats(inspector, inconsistencies):
     """Demonstrate different output formats."""
     print("\n📤 Output Format Examples")
     print("=" * 50)
     
-    inspector = PowerPointInspector()
-    
-    # Analyze sample slides
-    inconsistencies = inspector.analyze_presentation()
-    
     if inconsistencies:
         # Console output
         print("\n1. Console Output:")
@@ -108,7 +95,7 @@ def example_output_formats():
         inspector.report_generator.generate_report(
             inconsistencies, 
             output_format="json", 
-            output_file="example_output.json"
+            output="example_output.json"
         )
         print("   Saved to: example_output.json")
         
@@ -117,7 +104,7 @@ def example_output_formats():
         inspector.report_generator.generate_report(
             inconsistencies, 
             output_format="csv", 
-            output_file="example_output.csv"
+            output="example_output.csv"
         )
         print("   Saved to: example_output.csv")
     else:
@@ -137,10 +124,21 @@ def main():
             print("   Set it using: export GEMINI_API_KEY='your_key_here'")
             print()
         
-        # Run examples
-        example_basic_usage()
+        # Build the inspector and analyze the sample slides once, then
+        # share the results across the examples
+        inspector, inconsistencies = None, []
+        try:
+            inspector = PowerPointInspector()
+            inconsistencies = inspector.analyze_presentation()
+        except Exception as e:
+            print(f"Error analyzing sample slides: {e}")
+
+        # Run examples; the custom analysis example only reads the config
+        if inspector is not None:
+            example_basic_usage(inspector, inconsistencies)
         example_custom_analysis()
-        example_output_formats()
+        if inspector is not None:
+            example_output_formats(inspector, inconsistencies)
         
         print("\n✅ Examples completed successfully!")
         print("\n📁 Generated files:")
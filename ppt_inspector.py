@@ -8,22 +8,50 @@ factual and logical inconsistencies across slides.
 
 import os
 import sys
+import csv
+import glob
 import json
+import time
+import shelve
+import atexit
+import zlib
+import mmap
+import hashlib
 import logging
+import warnings
+import functools
 import argparse
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet, TextIO, Union, Callable
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import re
 
-import google.generativeai as genai
 from dotenv import load_dotenv
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON with orjson when available; both raise json.JSONDecodeError."""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+def _json_dumps_pretty(obj: Any) -> bytes:
+    """Serialize obj as indented UTF-8 JSON, with orjson when available.
+    
+    Dataclass instances are serialized as their fields: natively by orjson,
+    through asdict with the stdlib encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=asdict).encode()
 
 # Load environment variables
 load_dotenv()
@@ -32,9 +60,122 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class Inconsistency:
+# Numerical patterns by kind; each kind wraps its own value/unit groups
+_NUM_PATTERNS = (
+    ("currency", r'\$(?P<currency_value>\d+(?:,\d{3})*(?:\.\d{2})?)(?P<currency_unit>[MBK]?)'),  # $2M, $3M, etc.
+    ("dollars", r'(?P<dollars_value>\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?P<dollars_unit>[MBK]?)\s*dollars?'),  # 2M dollars
+    ("minutes", r'(?P<minutes_value>\d+)\s*(?:mins?|minutes?)'),  # 15 mins, 20 minutes
+    ("hours", r'(?P<hours_value>\d+)\s*(?:hours?|hrs?)'),  # 10 hours, 50 hrs
+    ("percentage", r'(?P<percentage_value>\d+(?:\.\d+)?)\s*(?:%|percent)'),  # 25%, 12.5%, 25 percent
+    ("multiplier", r'(?P<multiplier_value>\d+)(?:x|\s*times)\s*faster'),  # 2x faster, 2 times faster
+)
+# All patterns fused into one alternation so each text is scanned once; the
+# outer named group (match.lastgroup) identifies the kind of value
+NUM_PATTERN = "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in _NUM_PATTERNS)
+
+@functools.lru_cache(maxsize=None)
+def _numerical_regex() -> "re.Pattern":
+    """Compile NUM_PATTERN once per process, when the first extractor is built.
+    
+    CLI paths that never extract (--help, argument errors) skip the compile.
+    Caching the compiled pattern on disk would not help: re.Pattern pickles
+    as its source and is recompiled on load.
+    """
+    return re.compile(NUM_PATTERN, re.IGNORECASE)
+
+_HAS_DIGIT = re.compile(r'\d')
+
+_UNIT_SCALE = {"M": 1000000, "B": 1000000000, "K": 1000}
+
+def _parse_amount(text: str) -> float:
+    return float(text.replace(',', ''))
+
+# NUM_PATTERN outer group -> (value group, scale group, unit, context, converter),
+# built once so each match is one dict lookup instead of a chain of branches
+NUM_KINDS = {
+    "currency": ("currency_value", "currency_unit", "USD", "currency", _parse_amount),
+    "dollars": ("dollars_value", "dollars_unit", "USD", "currency", _parse_amount),
+    "minutes": ("minutes_value", None, "minutes", "time_savings", int),
+    "hours": ("hours_value", None, "hours", "time_savings", int),
+    "percentage": ("percentage_value", None, "percentage", "percentage", float),
+    "multiplier": ("multiplier_value", None, "multiplier", "performance_improvement", int),
+}
+
+def _find_numeric_conflicts(group_ids, values, first, seen, conflicted):
+    """Flag in conflicted every group holding a value that differs from its first.
+    
+    A plain loop over flat arrays so numba can compile it unchanged (see
+    _conflict_kernel); callers allocate the per-group arrays.
+    """
+    for k in range(group_ids.shape[0]):
+        group = group_ids[k]
+        if not seen[group]:
+            seen[group] = True
+            first[group] = values[k]
+        elif values[k] != first[group]:
+            conflicted[group] = True
+
+@functools.lru_cache(maxsize=None)
+def _conflict_kernel():
+    """Return _find_numeric_conflicts, JIT-compiled when numba is installed.
+    
+    numba is imported on first use rather than at module import, as it is
+    slow to load; cache=True keeps the compiled kernel on disk across runs.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional
+        return _find_numeric_conflicts
+    return njit(cache=True)(_find_numeric_conflicts)
+
+# Phrases that mark a sentence as a key claim, matched case-insensitively
+# anywhere in the sentence
+KEY_PHRASES = [
+    "AI-powered", "automated", "faster", "efficient", "streamlined",
+    "competitive", "market leader", "innovative", "cutting-edge",
+    "time-saving", "productivity", "efficiency", "accuracy"
+]
+# Lowercased once at import; a plain substring scan over a lowercased
+# sentence beats an IGNORECASE alternation, which retries every phrase at
+# every position
+_KEY_PHRASES_LOWER = tuple(phrase.lower() for phrase in KEY_PHRASES)
+# Sentence terminators mapped to NUL so sentences split with str.split;
+# runs like "..." leave empty pieces that callers skip
+_SENT_TRANS = str.maketrans({".": "\x00", "!": "\x00", "?": "\x00"})
+
+# On average one line in this many ends a content-defined block when
+# deduplicating slide text for the AI prompt
+CHUNK_BOUNDARY_MODULUS = 4
+
+# Shape the model must return for one deck; a compact schema costs far fewer
+# prompt tokens than describing the format in prose
+AI_RESPONSE_SCHEMA = (
+    '{"inconsistencies":[{"slide_numbers":[int],"type":str,"description":str,'
+    '"confidence":float,"evidence":[str],"recommendation":str}]}'
+)
+
+class _FrozenSlotsState:
+    """Copy and pickle support for frozen dataclasses with hand-written __slots__.
+    
+    Slotted objects are restored with setattr, which frozen dataclasses
+    reject; dataclass(slots=True) generates these methods, but only from 3.10.
+    """
+    __slots__ = ()
+    
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+@dataclass(frozen=True)
+class Inconsistency(_FrozenSlotsState):
     """Represents a detected inconsistency."""
+    # Declared by hand rather than dataclass(slots=True) to keep Python 3.8 support.
+    # Frozen, as is SlideContent: results are built once and only read after
+    __slots__ = ("slide_numbers", "inconsistency_type", "description", "confidence", "evidence", "recommendation")
+    
     slide_numbers: List[int]
     inconsistency_type: str
     description: str
@@ -42,57 +183,319 @@ class Inconsistency:
     evidence: List[str]
     recommendation: str
 
-@dataclass
-class SlideContent:
+@dataclass(frozen=True)
+class SlideContent(_FrozenSlotsState):
     """Represents extracted content from a slide."""
+    __slots__ = ("slide_number", "text_content", "numerical_data", "key_claims", "metadata")
+    
     slide_number: int
     text_content: str
     numerical_data: List[Dict[str, Any]]
     key_claims: List[str]
     metadata: Dict[str, Any]
+    
+    @classmethod
+    def to_numeric_table(cls, slides: List["SlideContent"]) -> "NumericTable":
+        """Flatten the numerical data of slides into one NumericTable."""
+        import numpy as np
+        slide_ids, context_names, values, rows = [], [], [], []
+        for slide in slides:
+            for data in slide.numerical_data:
+                slide_ids.append(slide.slide_number)
+                context_names.append(data.get("context", "unknown"))
+                values.append(data["value"])
+                rows.append(data)
+        # Contexts are free text, so there is no bound on how many a deck has;
+        # np.unique codes them as intp indices into the sorted distinct names
+        contexts, types = np.unique(np.array(context_names, dtype=object), return_inverse=True)
+        return NumericTable(
+            slide_ids=np.array(slide_ids, dtype=np.int32),
+            types=types.astype(np.intp, copy=False).reshape(-1),
+            values=np.array(values, dtype=np.float64),
+            contexts=tuple(contexts.tolist()),
+            rows=rows
+        )
+
+@dataclass
+class NumericTable:
+    """Column-wise view of every numerical value in a deck.
+    
+    Row k is the k-th value across all slides, in slide order; types index
+    into contexts. The numerical_data dicts stay the source for reporting.
+    """
+    __slots__ = ("slide_ids", "types", "values", "contexts", "rows")
+    
+    slide_ids: Any  # np.ndarray[int32]
+    types: Any  # np.ndarray[intp]
+    values: Any  # np.ndarray[float64]
+    contexts: Tuple[str, ...]
+    rows: List[Dict[str, Any]]
+
+def _iter_json_array_items(text: str, key: str):
+    """Yield each complete element of the JSON array stored under key in text.
+    
+    Decoding stops at the first element that cannot be parsed, so a body cut
+    off mid-array still yields every element before the break.
+    """
+    match = re.search(r'"%s"\s*:\s*\[' % re.escape(key), text)
+    if not match:
+        return
+    decoder = json.JSONDecoder()
+    pos = match.end()
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            return
+        try:
+            item, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return
+        if isinstance(item, dict):
+            yield item
+
+class ResponseCache:
+    """Disk-backed exact-match cache for AI model responses.
+    
+    Entries are mirrored in an in-memory LRU; once more than maxsize are
+    stored the least recently used one is evicted from memory and disk.
+    """
+    
+    def __init__(self, cache_dir: str = None, ttl: int = 86400, maxsize: int = 1000):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "ppt_inspector"
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: Optional["OrderedDict[str, Tuple[float, str]]"] = None
+    
+    def _open(self) -> shelve.Shelf:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return shelve.open(str(self.cache_dir / "responses"))
+    
+    def _load(self) -> "OrderedDict[str, Tuple[float, str]]":
+        if self._entries is None:
+            self._entries = OrderedDict()
+            try:
+                with self._open() as db:
+                    # Oldest first, so earlier runs' entries are evicted first
+                    for key, entry in sorted(db.items(), key=lambda item: item[1][0]):
+                        self._entries[key] = entry
+            except Exception as e:
+                logger.warning(f"Response cache read failed: {e}")
+        return self._entries
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None if missing or expired."""
+        entries = self._load()
+        entry = entries.get(key)
+        
+        if entry is None or entry[0] < time.time():
+            self.stats["misses"] += 1
+            return None
+        
+        entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[1]
+    
+    def set(self, key: str, value: str, ttl: int = None) -> None:
+        """Store value under key for ttl seconds (defaults to the cache TTL)."""
+        entry = (time.time() + (self.ttl if ttl is None else ttl), value)
+        entries = self._load()
+        entries[key] = entry
+        entries.move_to_end(key)
+        
+        evicted = []
+        while len(entries) > self.maxsize:
+            evicted.append(entries.popitem(last=False)[0])
+        
+        try:
+            with self._open() as db:
+                db[key] = entry
+                for old_key in evicted:
+                    db.pop(old_key, None)
+        except Exception as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+class SemanticCache:
+    """Embedding-similarity cache for near-duplicate deck summaries.
+    
+    Requires the optional sentence-transformers package; without it every
+    lookup is a miss. A hit also requires the stored entry to carry exactly
+    the same key entities (slide numbers, numeric values) as the query, so
+    decks that differ only in a figure never share a response.
+    """
+    
+    def __init__(self, cache_dir: str = None, threshold: float = 0.95, model_name: str = "all-MiniLM-L6-v2", maxsize: int = 1000):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "ppt_inspector"
+        self.threshold = threshold
+        self.model_name = model_name
+        self.maxsize = maxsize
+        self.stats = {"hits": 0, "misses": 0}
+        self._embedder = None
+        self._enabled = True
+        # text hash -> (embedding, entities, response), least recently used first
+        self._index: Optional["OrderedDict[str, Tuple[Any, FrozenSet[str], str]]"] = None
+        self._dirty = False
+    
+    def _get_embedder(self):
+        if self._embedder is None and self._enabled:
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._embedder = SentenceTransformer(self.model_name)
+            except ImportError:
+                logger.debug("sentence-transformers not installed; semantic cache disabled")
+                self._enabled = False
+        return self._embedder
+    
+    def _index_path(self) -> Path:
+        return self.cache_dir / "semantic_index.npz"
+    
+    def _load(self) -> "OrderedDict[str, Tuple[Any, FrozenSet[str], str]]":
+        if self._index is None:
+            self._index = OrderedDict()
+            path = self._index_path()
+            if path.exists():
+                import numpy as np
+                try:
+                    data = np.load(path, allow_pickle=False)
+                    for key, embedding, entities, response_text in zip(data["keys"], data["embeddings"], data["entities"], data["responses"]):
+                        self._index[str(key)] = (embedding, frozenset(json.loads(str(entities))), str(response_text))
+                except Exception as e:
+                    logger.warning(f"Could not load semantic cache index: {e}")
+        return self._index
+    
+    def _encode(self, text: str):
+        embedder = self._get_embedder()
+        if embedder is None:
+            return None
+        return embedder.encode(text, normalize_embeddings=True)
+    
+    def lookup(self, text: str, entities: FrozenSet[str]) -> Optional[str]:
+        """Return a cached response for a semantically equivalent text, if any."""
+        query = self._encode(text)
+        if query is not None:
+            import numpy as np
+            index = self._load()
+            for key, (embedding, cached_entities, response_text) in index.items():
+                if cached_entities == entities and float(np.dot(embedding, query)) > self.threshold:
+                    index.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return response_text
+        self.stats["misses"] += 1
+        return None
+    
+    def add(self, text: str, entities: FrozenSet[str], response_text: str) -> None:
+        """Store a response under the embedding of text."""
+        embedding = self._encode(text)
+        if embedding is None:
+            return
+        index = self._load()
+        key = hashlib.blake2b(text.encode()).hexdigest()
+        index[key] = (embedding, entities, response_text)
+        index.move_to_end(key)
+        while len(index) > self.maxsize:
+            index.popitem(last=False)
+        if not self._dirty:
+            self._dirty = True
+            atexit.register(self.save)
+    
+    def save(self) -> None:
+        """Persist the index to disk."""
+        if not self._index:
+            return
+        import numpy as np
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entries = list(self._index.values())
+            np.savez(
+                self._index_path(),
+                keys=np.array(list(self._index)),
+                embeddings=np.stack([entry[0] for entry in entries]),
+                entities=np.array([json.dumps(sorted(entry[1])) for entry in entries]),
+                responses=np.array([entry[2] for entry in entries]),
+            )
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"Could not save semantic cache index: {e}")
+
+# Slides repeat boilerplate (footers, headers, taglines), so extraction
+# results are cached by text; tuples because lru_cache results are shared
+EXTRACTION_CACHE_SIZE = 4096
+
+@functools.lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def _extract_numerical_data_cached(text: str) -> Tuple[Tuple[Any, str, str, str], ...]:
+    """Return (value, unit, context, original_text) for each number in text."""
+    # Title and divider slides often have no digits at all
+    if not _HAS_DIGIT.search(text):
+        return ()
+    
+    numerical_data = []
+    
+    for match in _numerical_regex().finditer(text):
+        value_group, scale_group, unit, context, convert = NUM_KINDS[match.lastgroup]
+        value = convert(match.group(value_group))
+        if scale_group is not None:
+            # $2M, 3B dollars, ...
+            value *= _UNIT_SCALE.get(match.group(scale_group), 1)
+        
+        numerical_data.append((value, unit, context, match.group(0)))
+    
+    return tuple(numerical_data)
+
+@functools.lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def _extract_key_claims_cached(text: str) -> Tuple[str, ...]:
+    """Return up to five key-claim sentences from text."""
+    # Simple keyword-based extraction - could be enhanced with NLP
+    claims = []
+    for sentence in text.translate(_SENT_TRANS).split("\x00"):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        sentence_lower = sentence.lower()
+        if any(phrase in sentence_lower for phrase in _KEY_PHRASES_LOWER):
+            claims.append(sentence)
+            if len(claims) == 5:  # Limit to top 5 claims
+                break
+    
+    return tuple(claims)
+
+# Decks at least this large are opened through a read-only memory map so
+# zipfile reads the slide parts straight from the page cache
+PPTX_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+class _ReadOnlyMap(mmap.mmap):
+    """A memory map zipfile accepts as a file; mmap only has seekable() from 3.13."""
+    
+    def seekable(self) -> bool:
+        return True
 
 class ContentExtractor:
     """Extracts content from PowerPoint files and images."""
     
     def __init__(self):
         self.console = Console()
+        _numerical_regex()  # compile up front rather than on the first slide
     
     def extract_from_pptx(self, file_path: str) -> List[SlideContent]:
         """Extract content from PowerPoint file."""
         try:
             from pptx import Presentation
             
-            presentation = Presentation(file_path)
-            slides_content = []
+            if os.path.isfile(file_path) and os.path.getsize(file_path) >= PPTX_MMAP_THRESHOLD:
+                # python-pptx reads every part while opening, so the map can
+                # be closed before the slides are walked
+                with open(file_path, "rb") as f, _ReadOnlyMap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    presentation = Presentation(mapped)
+            else:
+                presentation = Presentation(file_path)
+            slides = list(enumerate(presentation.slides, 1))
             
-            for i, slide in enumerate(presentation.slides, 1):
-                text_content = []
-                numerical_data = []
-                key_claims = []
-                
-                # Extract text from shapes
-                for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text.strip():
-                        text_content.append(shape.text.strip())
-                
-                # Extract numerical data using regex
-                full_text = " ".join(text_content)
-                numbers = self._extract_numerical_data(full_text)
-                numerical_data.extend(numbers)
-                
-                # Extract key claims
-                key_claims = self._extract_key_claims(full_text)
-                
-                slide_content = SlideContent(
-                    slide_number=i,
-                    text_content="\n".join(text_content),
-                    numerical_data=numerical_data,
-                    key_claims=key_claims,
-                    metadata={"source": "pptx", "shapes_count": len(slide.shapes)}
-                )
-                slides_content.append(slide_content)
-            
-            return slides_content
+            # Slides are independent, so large decks are extracted in parallel;
+            # executor.map keeps slide order
+            if len(slides) < 4:
+                return [self._extract_one_slide(item) for item in slides]
+            with ThreadPoolExecutor(max_workers=min(8, len(slides))) as executor:
+                return list(executor.map(self._extract_one_slide, slides))
             
         except ImportError:
             self.console.print("[red]python-pptx not installed. Install with: pip install python-pptx[/red]")
@@ -101,6 +504,32 @@ class ContentExtractor:
             logger.error(f"Error extracting from PPTX: {e}")
             return []
     
+    def _extract_one_slide(self, idx_slide: Tuple[int, Any]) -> SlideContent:
+        """Extract content from a single (slide_number, slide) pair."""
+        i, slide = idx_slide
+        text_content = []
+        numerical_data = []
+        
+        # Extract text and numerical data from each shape in one pass
+        for shape in slide.shapes:
+            text = getattr(shape, "text", "").strip()
+            if not text:
+                continue
+            text_content.append(text)
+            numerical_data.extend(self._extract_numerical_data(text))
+        
+        # Key claims need sentence context across shapes
+        full_text = "\n".join(text_content)
+        key_claims = self._extract_key_claims(full_text)
+        
+        return SlideContent(
+            slide_number=i,
+            text_content=full_text,
+            numerical_data=numerical_data,
+            key_claims=key_claims,
+            metadata={"source": "pptx", "shapes_count": len(slide.shapes)}
+        )
+    
     def extract_from_images(self, images_dir: str) -> List[SlideContent]:
         """Extract content from image files (placeholder for OCR integration)."""
         # This would integrate with OCR services like Tesseract or cloud OCR APIs
@@ -149,125 +578,50 @@ class ContentExtractor:
     
     def _extract_numerical_data(self, text: str) -> List[Dict[str, Any]]:
         """Extract numerical data from text using regex patterns."""
-        numerical_data = []
-        
-        # Currency patterns
-        currency_patterns = [
-            r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)([MBK]?)',  # $2M, $3M, etc.
-            r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*([MBK]?)\s*dollars?',  # 2M dollars
-        ]
-        
-        # Time patterns
-        time_patterns = [
-            r'(\d+)\s*(?:mins?|minutes?)',  # 15 mins, 20 minutes
-            r'(\d+)\s*(?:hours?|hrs?)',    # 10 hours, 50 hrs
-        ]
-        
-        # Percentage patterns
-        percentage_patterns = [
-            r'(\d+(?:\.\d+)?)\s*%',  # 25%, 12.5%
-            r'(\d+(?:\.\d+)?)\s*percent',  # 25 percent
-        ]
-        
-        # Multiplier patterns
-        multiplier_patterns = [
-            r'(\d+)x\s*faster',  # 2x faster, 3x faster
-            r'(\d+)\s*times\s*faster',  # 2 times faster
+        # Fresh dicts per call, so callers never share the cached tuples' data
+        return [
+            {"value": value, "unit": unit, "context": context, "original_text": original_text}
+            for value, unit, context, original_text in _extract_numerical_data_cached(text)
         ]
-        
-        for pattern in currency_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                value = float(match.group(1).replace(',', ''))
-                unit = match.group(2) if match.group(2) else 'USD'
-                if unit == 'M':
-                    value *= 1000000
-                elif unit == 'B':
-                    value *= 1000000000
-                elif unit == 'K':
-                    value *= 1000
-                
-                numerical_data.append({
-                    "value": value,
-                    "unit": "USD",
-                    "context": "currency",
-                    "original_text": match.group(0)
-                })
-        
-        for pattern in time_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                value = int(match.group(1))
-                unit = "minutes" if "min" in match.group(0).lower() else "hours"
-                numerical_data.append({
-                    "value": value,
-                    "unit": unit,
-                    "context": "time_savings",
-                    "original_text": match.group(0)
-                })
-        
-        for pattern in percentage_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                value = float(match.group(1))
-                numerical_data.append({
-                    "value": value,
-                    "unit": "percentage",
-                    "context": "percentage",
-                    "original_text": match.group(0)
-                })
-        
-        for pattern in multiplier_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                value = int(match.group(1))
-                numerical_data.append({
-                    "value": value,
-                    "unit": "multiplier",
-                    "context": "performance_improvement",
-                    "original_text": match.group(0)
-                })
-        
-        return numerical_data
     
     def _extract_key_claims(self, text: str) -> List[str]:
         """Extract key claims and statements from text."""
-        # Simple keyword-based extraction - could be enhanced with NLP
-        key_phrases = [
-            "AI-powered", "automated", "faster", "efficient", "streamlined",
-            "competitive", "market leader", "innovative", "cutting-edge",
-            "time-saving", "productivity", "efficiency", "accuracy"
-        ]
-        
-        claims = []
-        sentences = re.split(r'[.!?]+', text)
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(phrase.lower() in sentence.lower() for phrase in key_phrases):
-                claims.append(sentence)
-        
-        return claims[:5]  # Limit to top 5 claims
+        return list(_extract_key_claims_cached(text))
 
 class AIAnalyzer:
     """Uses Gemini AI to analyze content for inconsistencies."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache: ResponseCache = None, semantic_cache: SemanticCache = None, cache_maxsize: int = 1000, cache_disabled: bool = False):
+        # Imported here so CLI paths that never reach the analyzer (--help,
+        # argument errors) skip loading the Gemini SDK
+        import google.generativeai as genai
+        self._genai = genai
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.model_name = 'gemini-2.0-flash-exp'
+        self.model = genai.GenerativeModel(
+            self.model_name,
+            generation_config={"response_mime_type": "application/json"}
+        )
+        self.cache = cache if cache is not None else ResponseCache(ttl=86400, maxsize=cache_maxsize)
+        self.semantic_cache = semantic_cache if semantic_cache is not None else SemanticCache(maxsize=cache_maxsize)
+        # Always call the model, e.g. for tests that mock generate_content
+        self.cache_disabled = cache_disabled
         self.console = Console()
     
     def analyze_inconsistencies(self, slides_content: List[SlideContent]) -> List[Inconsistency]:
         """Analyze slides for inconsistencies using AI."""
         inconsistencies = []
         
-        # Rule-based checks first
-        rule_based = self._rule_based_checks(slides_content)
-        inconsistencies.extend(rule_based)
-        
-        # AI-powered analysis
-        ai_based = self._ai_based_analysis(slides_content)
-        inconsistencies.extend(ai_based)
+        # The AI request is network-bound, so start it on a worker thread and
+        # run the local rule-based checks while it is in flight
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            ai_future = executor.submit(self._ai_based_analysis, slides_content)
+            
+            rule_based = self._rule_based_checks(slides_content)
+            inconsistencies.extend(rule_based)
+            
+            ai_based = ai_future.result()
+            inconsistencies.extend(ai_based)
         
         return inconsistencies
     
@@ -287,79 +641,60 @@ class AIAnalyzer:
     
     def _check_numerical_consistency(self, slides_content: List[SlideContent]) -> List[Inconsistency]:
         """Check for numerical data inconsistencies."""
+        import numpy as np
         inconsistencies = []
         
-        # Group numerical data by context
-        context_groups = {}
-        for slide in slides_content:
-            for data in slide.numerical_data:
-                context = data.get("context", "unknown")
-                if context not in context_groups:
-                    context_groups[context] = []
-                context_groups[context].append({
-                    "slide": slide.slide_number,
-                    "data": data
-                })
-        
-        # Check for conflicts within each context
-        for context, data_list in context_groups.items():
-            if len(data_list) < 2:
-                continue
+        table = SlideContent.to_numeric_table(slides_content)
+        n_groups = len(table.contexts)
+        conflicted = np.zeros(n_groups, dtype=np.bool_)
+        _conflict_kernel()(
+            table.types, table.values,
+            np.empty(n_groups, dtype=np.float64), np.zeros(n_groups, dtype=np.bool_), conflicted
+        )
+        
+        # Report each context whose values disagree
+        for group in np.flatnonzero(conflicted).tolist():
+            context = table.contexts[group]
+            members = np.flatnonzero(table.types == group).tolist()
+            slides_involved = table.slide_ids[members].tolist()
+            evidence = [f"Slide {table.slide_ids[k]}: {table.rows[k]['original_text']}" for k in members]
             
-            # Check for conflicting values
-            values = [item["data"]["value"] for item in data_list]
-            if len(set(values)) > 1:
-                slides_involved = [item["slide"] for item in data_list]
-                evidence = [f"Slide {item['slide']}: {item['data']['original_text']}" for item in data_list]
-                
-                inconsistency = Inconsistency(
-                    slide_numbers=slides_involved,
-                    inconsistency_type="numerical_conflict",
-                    description=f"Conflicting {context} values found across slides",
-                    confidence=0.95,
-                    evidence=evidence,
-                    recommendation=f"Standardize {context} values across all slides for consistency"
-                )
-                inconsistencies.append(inconsistency)
+            inconsistency = Inconsistency(
+                slide_numbers=slides_involved,
+                inconsistency_type="numerical_conflict",
+                description=f"Conflicting {context} values found across slides",
+                confidence=0.95,
+                evidence=evidence,
+                recommendation=f"Standardize {context} values across all slides for consistency"
+            )
+            inconsistencies.append(inconsistency)
         
         return inconsistencies
     
     def _check_claim_consistency(self, slides_content: List[SlideContent]) -> List[Inconsistency]:
         """Check for contradictory claims across slides."""
+        import numpy as np
         inconsistencies = []
         
-        # Check for performance improvement contradictions
-        performance_claims = {}
-        for slide in slides_content:
-            for data in slide.numerical_data:
-                if data.get("context") == "performance_improvement":
-                    value = data["value"]
-                    if "performance_improvement" not in performance_claims:
-                        performance_claims["performance_improvement"] = []
-                    performance_claims["performance_improvement"].append({
-                        "slide": slide.slide_number,
-                        "value": value,
-                        "text": data["original_text"]
-                    })
-        
-        # Check for conflicting performance claims
-        if "performance_improvement" in performance_claims:
-            claims = performance_claims["performance_improvement"]
-            if len(claims) > 1:
-                values = [claim["value"] for claim in claims]
-                if len(set(values)) > 1:
-                    slides_involved = [claim["slide"] for claim in claims]
-                    evidence = [f"Slide {claim['slide']}: {claim['text']}" for claim in claims]
-                    
-                    inconsistency = Inconsistency(
-                        slide_numbers=slides_involved,
-                        inconsistency_type="performance_claim_conflict",
-                        description="Conflicting performance improvement claims found",
-                        confidence=0.90,
-                        evidence=evidence,
-                        recommendation="Align performance improvement claims across all slides"
-                    )
-                    inconsistencies.append(inconsistency)
+        # Check for performance improvement contradictions, column-wise over
+        # the deck's numeric table
+        table = SlideContent.to_numeric_table(slides_content)
+        if "performance_improvement" in table.contexts:
+            members = np.flatnonzero(table.types == table.contexts.index("performance_improvement"))
+            if np.unique(table.values[members]).size > 1:
+                members = members.tolist()
+                slides_involved = table.slide_ids[members].tolist()
+                evidence = [f"Slide {table.slide_ids[k]}: {table.rows[k]['original_text']}" for k in members]
+                
+                inconsistency = Inconsistency(
+                    slide_numbers=slides_involved,
+                    inconsistency_type="performance_claim_conflict",
+                    description="Conflicting performance improvement claims found",
+                    confidence=0.90,
+                    evidence=evidence,
+                    recommendation="Align performance improvement claims across all slides"
+                )
+                inconsistencies.append(inconsistency)
         
         return inconsistencies
     
@@ -371,86 +706,214 @@ class AIAnalyzer:
             # Prepare content for AI analysis
             content_summary = self._prepare_content_summary(slides_content)
             
-            prompt = f"""
-            Analyze the following PowerPoint presentation content for factual and logical inconsistencies.
-            
-            Content Summary:
-            {content_summary}
-            
-            Please identify any:
-            1. Contradictory statements or claims
-            2. Inconsistent numerical data
-            3. Timeline mismatches
-            4. Brand or product inconsistencies
-            5. Logical contradictions
-            
-            For each inconsistency found, provide:
-            - Slide numbers involved
-            - Type of inconsistency
-            - Description
-            - Evidence
-            - Recommendation
-            
-            Return your analysis in JSON format.
-            """
-            
-            response = self.model.generate_content(prompt)
+            prompt = (
+                "Find factual, numerical, timeline and logical inconsistencies between slides.\n"
+                f"Return JSON matching: {AI_RESPONSE_SCHEMA}\n\n"
+                f"Slides:\n{content_summary}"
+            )
             
-            # Parse AI response
-            try:
-                ai_analysis = json.loads(response.text)
-                if "inconsistencies" in ai_analysis:
-                    for item in ai_analysis["inconsistencies"]:
-                        inconsistency = Inconsistency(
-                            slide_numbers=item.get("slide_numbers", []),
-                            inconsistency_type=item.get("type", "ai_detected"),
-                            description=item.get("description", ""),
-                            confidence=item.get("confidence", 0.7),
-                            evidence=item.get("evidence", []),
-                            recommendation=item.get("recommendation", "")
-                        )
-                        inconsistencies.append(inconsistency)
-            except json.JSONDecodeError:
-                logger.warning("AI response not in valid JSON format")
+            ai_analysis = self._generate_cached(
+                prompt, self._parse_deck_response, content_summary, self._key_entities(slides_content)
+            )
+            inconsistencies.extend(self._parse_ai_inconsistencies(ai_analysis))
                 
         except Exception as e:
             logger.error(f"AI analysis failed: {e}")
         
         return inconsistencies
     
+    def _parse_deck_response(self, response_text: str) -> Tuple[Dict[str, Any], bool]:
+        """Parse one deck's AI response; the flag is False if items had to be salvaged."""
+        try:
+            ai_analysis = _json_loads(response_text)
+            if isinstance(ai_analysis, dict):
+                return ai_analysis, True
+        except json.JSONDecodeError:
+            pass
+        # Salvage complete items from a truncated or malformed body instead
+        # of dropping everything
+        ai_analysis = {"inconsistencies": list(_iter_json_array_items(response_text, "inconsistencies"))}
+        logger.warning(
+            f"AI response not in valid JSON format; recovered {len(ai_analysis['inconsistencies'])} items"
+        )
+        return ai_analysis, False
+    
+    def _parse_ai_inconsistencies(self, ai_analysis: Dict[str, Any]) -> List[Inconsistency]:
+        """Build Inconsistency objects from one parsed AI analysis object."""
+        inconsistencies = []
+        # Types and recommendations repeat verbatim across items; share one
+        # string object per distinct value
+        recommendation_pool: Dict[str, str] = {}
+        for item in ai_analysis.get("inconsistencies", []):
+            recommendation = str(item.get("recommendation", ""))
+            inconsistency = Inconsistency(
+                slide_numbers=item.get("slide_numbers", []),
+                inconsistency_type=sys.intern(str(item.get("type", "ai_detected"))),
+                description=item.get("description", ""),
+                confidence=item.get("confidence", 0.7),
+                evidence=item.get("evidence", []),
+                recommendation=recommendation_pool.setdefault(recommendation, recommendation)
+            )
+            inconsistencies.append(inconsistency)
+        return inconsistencies
+    
+    def analyze_batch(self, decks: List[List[SlideContent]]) -> List[List[Inconsistency]]:
+        """Analyze several decks, packing all AI analysis into a single request.
+        
+        Rule-based checks still run per deck. One prompt carries every deck
+        summary and asks for a JSON array with one element per deck, which
+        trades a larger request for fewer round-trips.
+        """
+        results = [self._rule_based_checks(slides_content) for slides_content in decks]
+        if not decks:
+            return results
+        
+        try:
+            deck_summaries = "\n".join(
+                f"DECK {i}:\n{self._prepare_content_summary(slides_content)}"
+                for i, slides_content in enumerate(decks, 1)
+            )
+            prompt = (
+                "Find factual, numerical, timeline and logical inconsistencies between slides "
+                "of each deck. Decks are independent; never compare across decks.\n"
+                f"Return a JSON array of {len(decks)} elements, one per deck in order, "
+                f"each matching: {AI_RESPONSE_SCHEMA}\n\n"
+                f"{deck_summaries}"
+            )
+            
+            deck_analyses = self._generate_cached(
+                prompt, lambda response_text: self._parse_batch_response(response_text, len(decks))
+            )
+            if deck_analyses is not None:
+                for deck_result, ai_analysis in zip(results, deck_analyses):
+                    deck_result.extend(self._parse_ai_inconsistencies(ai_analysis))
+                
+        except Exception as e:
+            logger.error(f"AI batch analysis failed: {e}")
+        
+        return results
+    
+    def _parse_batch_response(self, response_text: str, n_decks: int) -> Tuple[Optional[List[Dict[str, Any]]], bool]:
+        """Parse a batched AI response into one analysis per deck, or None if unusable."""
+        try:
+            deck_analyses = _json_loads(response_text)
+        except json.JSONDecodeError:
+            logger.warning("AI batch response not in valid JSON format")
+            return None, False
+        if (not isinstance(deck_analyses, list) or len(deck_analyses) != n_decks
+                or not all(isinstance(ai_analysis, dict) for ai_analysis in deck_analyses)):
+            logger.warning("AI batch response does not have one element per deck")
+            return None, False
+        return deck_analyses, True
+    
+    def _generate_cached(self, prompt: str, parse: Callable[[str], Tuple[Any, bool]], summary: str = None, entities: FrozenSet[str] = None) -> Any:
+        """Return the parsed model response for prompt, consulting the caches unless disabled.
+        
+        parse returns (result, complete). An unchanged corpus yields the same
+        prompt, so it is served from the response cache; near-duplicate decks
+        (when summary is given) from the semantic cache. Only complete
+        responses are cached, so a truncated or non-JSON answer is never
+        replayed.
+        """
+        if self.cache_disabled:
+            return parse(self.model.generate_content(prompt).text)[0]
+        
+        cache_key = hashlib.sha256((self.model_name + prompt).encode()).hexdigest()
+        response_text = self.cache.get(cache_key)
+        if response_text is None and summary is not None:
+            response_text = self.semantic_cache.lookup(summary, entities)
+        if response_text is not None:
+            return parse(response_text)[0]
+        
+        response_text = self.model.generate_content(prompt).text
+        result, complete = parse(response_text)
+        if complete:
+            if summary is not None:
+                self.semantic_cache.add(summary, entities, response_text)
+            self.cache.set(cache_key, response_text)
+        return result
+    
+    def _key_entities(self, slides_content: List[SlideContent]) -> FrozenSet[str]:
+        """Collect slide numbers and numeric values that a cached response must match."""
+        entities = set()
+        for slide in slides_content:
+            entities.add(f"slide:{slide.slide_number}")
+            for data in slide.numerical_data:
+                entities.add(f"{data['value']}{data['unit']}")
+        return frozenset(entities)
+    
+    def _dedup_text_blocks(self, text: str, slide_number: int, seen_blocks: Dict[str, int]) -> str:
+        """Replace text blocks already seen on an earlier slide with a reference to it.
+        
+        Lines are grouped into content-defined blocks that end after any line
+        whose CRC falls on a chunk boundary, so identical headers and footers
+        split into identical blocks wherever they appear in a slide.
+        """
+        blocks = []
+        current = []
+        for line in text.splitlines():
+            current.append(line)
+            if zlib.crc32(line.encode()) % CHUNK_BOUNDARY_MODULUS == 0:
+                blocks.append("\n".join(current))
+                current = []
+        if current:
+            blocks.append("\n".join(current))
+        
+        deduped = []
+        for block in blocks:
+            first_slide = seen_blocks.setdefault(block, slide_number) if block.strip() else slide_number
+            deduped.append(block if first_slide == slide_number else f"[duplicate of slide {first_slide}]")
+        return "\n".join(deduped)
+    
     def _prepare_content_summary(self, slides_content: List[SlideContent]) -> str:
         """Prepare a summary of slide content for AI analysis."""
         summary_parts = []
+        seen_blocks: Dict[str, int] = {}
         
         for slide in slides_content:
-            slide_summary = f"Slide {slide.slide_number}:\n"
-            slide_summary += f"Text: {slide.text_content[:200]}...\n"
+            # Repeated boilerplate is replaced by a pointer to its first slide;
+            # slide.text_content itself stays intact for the rule-based checks
+            text = self._dedup_text_blocks(slide.text_content, slide.slide_number, seen_blocks)
+            slide_parts = [f"Slide {slide.slide_number}:\nText: {text[:200]}...\n"]
             
             if slide.numerical_data:
-                numbers = [f"{d['value']}{d['unit']} ({d['context']})" for d in slide.numerical_data]
-                slide_summary += f"Numbers: {', '.join(numbers)}\n"
+                numbers = ", ".join(f"{d['value']}{d['unit']} ({d['context']})" for d in slide.numerical_data)
+                slide_parts.append(f"Numbers: {numbers}\n")
             
             if slide.key_claims:
-                slide_summary += f"Claims: {', '.join(slide.key_claims[:3])}\n"
+                slide_parts.append(f"Claims: {', '.join(slide.key_claims[:3])}\n")
             
-            summary_parts.append(slide_summary)
+            summary_parts.append("".join(slide_parts))
         
         return "\n".join(summary_parts)
 
 class ReportGenerator:
     """Generates structured reports of detected inconsistencies."""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.console = Console()
+        self.verbose = verbose
     
-    def generate_report(self, inconsistencies: List[Inconsistency], output_format: str = "console", output_file: str = None) -> None:
-        """Generate and output the inconsistency report."""
+    def generate_report(self, inconsistencies: List[Inconsistency], output_format: str = "console", output: Union[str, os.PathLike, TextIO] = None, output_file: str = None) -> None:
+        """Generate and output the inconsistency report.
+        
+        output is a file path, an open text stream (e.g. io.StringIO), or
+        None for stdout; console reports always go to the console.
+        output_file is the deprecated name for a path output.
+        """
+        if output_file is not None:
+            warnings.warn(
+                "generate_report(output_file=...) is deprecated; use output=...",
+                DeprecationWarning, stacklevel=2
+            )
+            if output is None:
+                output = output_file
         if output_format == "console":
             self._console_report(inconsistencies)
         elif output_format == "json":
-            self._json_report(inconsistencies, output_file)
+            self._json_report(inconsistencies, output)
         elif output_format == "csv":
-            self._csv_report(inconsistencies, output_file)
+            self._csv_report(inconsistencies, output)
         else:
             self._console_report(inconsistencies)
     
@@ -460,87 +923,127 @@ class ReportGenerator:
             self.console.print(Panel("✅ No inconsistencies detected!", style="green"))
             return
         
-        # Summary
-        self.console.print(Panel(f"🔍 Found {len(inconsistencies)} inconsistencies", style="yellow"))
+        # Summary; the whole report is collected into one Group so Rich
+        # renders and writes it in a single print instead of one per row
+        renderables = [Panel(f"🔍 Found {len(inconsistencies)} inconsistencies", style="yellow")]
         
         # Group by type
-        by_type = {}
+        by_type = defaultdict(list)
         for inc in inconsistencies:
-            inc_type = inc.inconsistency_type
-            if inc_type not in by_type:
-                by_type[inc_type] = []
-            by_type[inc_type].append(inc)
+            by_type[inc.inconsistency_type].append(inc)
         
-        # Display by type
+        # Display by type: one table per group, one row per inconsistency
         for inc_type, incs in by_type.items():
-            self.console.print(f"\n[bold blue]{inc_type.upper()}[/bold blue] ({len(incs)} issues)")
+            renderables.append(f"\n[bold blue]{inc_type.upper()}[/bold blue] ({len(incs)} issues)")
+            
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Slides", style="cyan")
+            table.add_column("Type", style="white")
+            table.add_column("Description", style="white")
+            table.add_column("Confidence", style="white")
+            table.add_column("Recommendation", style="white")
             
             for inc in incs:
-                table = Table(show_header=True, header_style="bold magenta")
-                table.add_column("Property", style="cyan")
-                table.add_column("Value", style="white")
-                
-                table.add_row("Slides", ", ".join(map(str, inc.slide_numbers)))
-                table.add_row("Type", inc.inconsistency_type)
-                table.add_row("Description", inc.description)
-                table.add_row("Confidence", f"{inc.confidence:.1%}")
-                table.add_row("Evidence", "\n".join(inc.evidence))
-                table.add_row("Recommendation", inc.recommendation)
-                
-                self.console.print(table)
-                self.console.print("")
+                table.add_row(
+                    ", ".join(map(str, inc.slide_numbers)),
+                    inc.inconsistency_type,
+                    inc.description,
+                    f"{inc.confidence:.1%}",
+                    inc.recommendation
+                )
+            
+            renderables.append(table)
+            
+            # Evidence is bulky; only show it when asked for
+            if self.verbose:
+                for inc in incs:
+                    renderables.append(f"[cyan]Evidence (slides {', '.join(map(str, inc.slide_numbers))}):[/cyan]")
+                    renderables.append("\n".join(inc.evidence))
+            renderables.append("")
+        
+        self.console.print(Group(*renderables))
     
-    def _json_report(self, inconsistencies: List[Inconsistency], output_file: str = None) -> None:
+    def _json_report(self, inconsistencies: List[Inconsistency], output: Union[str, os.PathLike, TextIO] = None) -> None:
         """Generate JSON report."""
         report = {
             "timestamp": datetime.now().isoformat(),
             "total_inconsistencies": len(inconsistencies),
-            "inconsistencies": [asdict(inc) for inc in inconsistencies]
+            "inconsistencies": inconsistencies
         }
         
-        if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(report, f, indent=2)
-            self.console.print(f"✅ JSON report saved to {output_file}")
+        data = _json_dumps_pretty(report)
+        if output is None:
+            print(data.decode())
+        elif isinstance(output, (str, os.PathLike)):
+            with open(output, 'wb') as f:
+                f.write(data)
+            self.console.print(f"✅ JSON report saved to {output}")
         else:
-            print(json.dumps(report, indent=2))
+            output.write(data.decode())
     
-    def _csv_report(self, inconsistencies: List[Inconsistency], output_file: str = None) -> None:
+    def _csv_report(self, inconsistencies: List[Inconsistency], output: Union[str, os.PathLike, TextIO] = None) -> None:
         """Generate CSV report."""
         if not inconsistencies:
             return
         
-        # Flatten inconsistencies for CSV
-        rows = []
-        for inc in inconsistencies:
-            for i, evidence in enumerate(inc.evidence):
-                row = {
-                    "slide_numbers": ", ".join(map(str, inc.slide_numbers)),
-                    "type": inc.inconsistency_type,
-                    "description": inc.description,
-                    "confidence": inc.confidence,
-                    "evidence": evidence,
-                    "recommendation": inc.recommendation
-                }
-                rows.append(row)
-        
-        df = pd.DataFrame(rows)
-        
-        if output_file:
-            df.to_csv(output_file, index=False)
-            self.console.print(f"✅ CSV report saved to {output_file}")
+        header = ("slide_numbers", "type", "description", "confidence", "evidence", "recommendation")
+        is_path = isinstance(output, (str, os.PathLike))
+        if is_path:
+            out = open(output, "w", newline="", encoding="utf-8", buffering=1 << 16)
         else:
-            print(df.to_csv(index=False))
+            out = output if output is not None else sys.stdout
+        try:
+            writer = csv.writer(out)
+            writer.writerow(header)
+            
+            # Flatten inconsistencies for CSV: one row per piece of evidence,
+            # read straight off the frozen dataclasses with no asdict() copy
+            for inc in inconsistencies:
+                slide_numbers = ", ".join(map(str, inc.slide_numbers))
+                writer.writerows(
+                    (slide_numbers, inc.inconsistency_type, inc.description,
+                     inc.confidence, evidence, inc.recommendation)
+                    for evidence in inc.evidence
+                )
+        finally:
+            if is_path:
+                out.close()
+        
+        if is_path:
+            self.console.print(f"✅ CSV report saved to {output}")
 
 class PowerPointInspector:
     """Main class for PowerPoint inconsistency detection."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, verbose: bool = False):
         self.extractor = ContentExtractor()
         self.analyzer = AIAnalyzer(api_key)
-        self.report_generator = ReportGenerator()
+        self.report_generator = ReportGenerator(verbose=verbose)
         self.console = Console()
     
+    def _progress(self):
+        """Create the spinner shown while analysis runs."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=self.console
+        )
+    
+    def analyze_presentations(self, file_paths: List[str]) -> List[List[Inconsistency]]:
+        """Analyze several PowerPoint files with one batched AI request."""
+        decks = []
+        for file_path in file_paths:
+            self.console.print(f"📊 Extracting PowerPoint file: {file_path}")
+            decks.append(self.extractor.extract_from_pptx(file_path))
+        
+        with self._progress() as progress:
+            task = progress.add_task(f"Analyzing {len(decks)} decks for inconsistencies...", total=None)
+            results = self.analyzer.analyze_batch(decks)
+            progress.update(task, completed=True)
+        
+        return results
+    
     def analyze_presentation(self, file_path: str = None, images_dir: str = None) -> List[Inconsistency]:
         """Analyze a presentation for inconsistencies."""
         if file_path:
@@ -559,11 +1062,7 @@ class PowerPointInspector:
         self.console.print(f"📝 Extracted content from {len(slides_content)} slides")
         
         # Analyze for inconsistencies
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console
-        ) as progress:
+        with self._progress() as progress:
             task = progress.add_task("Analyzing for inconsistencies...", total=None)
             inconsistencies = self.analyzer.analyze_inconsistencies(slides_content)
             progress.update(task, completed=True)
@@ -574,7 +1073,7 @@ def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="PowerPoint Inconsistency Detector")
     parser.add_argument("analyze", help="Analyze a presentation")
-    parser.add_argument("--file", help="Path to PowerPoint file (.pptx)")
+    parser.add_argument("--file", help="Path or glob pattern of PowerPoint file(s) (.pptx)")
     parser.add_argument("--images", help="Directory containing slide images")
     parser.add_argument("--output", help="Output file path")
     parser.add_argument("--format", choices=["json", "csv", "console"], default="console", help="Output format")
@@ -600,10 +1099,13 @@ def main():
         console.print("[red]Error: Either --file or --images must be specified[/red]")
         sys.exit(1)
     
-    if args.file and not os.path.exists(args.file):
-        console = Console()
-        console.print(f"[red]Error: File not found: {args.file}[/red]")
-        sys.exit(1)
+    file_paths = []
+    if args.file:
+        file_paths = [args.file] if os.path.exists(args.file) else sorted(glob.glob(args.file))
+        if not file_paths:
+            console = Console()
+            console.print(f"[red]Error: File not found: {args.file}[/red]")
+            sys.exit(1)
     
     if args.images and not os.path.exists(args.images):
         console = Console()
@@ -612,11 +1114,27 @@ def main():
     
     try:
         # Initialize inspector
-        inspector = PowerPointInspector(api_key)
+        inspector = PowerPointInspector(api_key, verbose=args.verbose)
+        
+        # Several decks share one batched AI request; each gets its own report
+        if len(file_paths) > 1:
+            results = inspector.analyze_presentations(file_paths)
+            for file_path, inconsistencies in zip(file_paths, results):
+                output_file = None
+                if args.output:
+                    output = Path(args.output)
+                    output_file = str(output.with_name(f"{output.stem}_{Path(file_path).stem}{output.suffix}"))
+                inspector.console.print(f"\n📄 {file_path}")
+                inspector.report_generator.generate_report(
+                    inconsistencies,
+                    output_format=args.format,
+                    output=output_file
+                )
+            sys.exit(1 if any(results) else 0)
         
         # Analyze presentation
         inconsistencies = inspector.analyze_presentation(
-            file_path=args.file,
+            file_path=file_paths[0] if file_paths else None,
             images_dir=args.images
         )
         
@@ -624,7 +1142,7 @@ def main():
         inspector.report_generator.generate_report(
             inconsistencies,
             output_format=args.format,
-            output_file=args.output
+            output=args.output
         )
         
         # Exit with appropriate code
@@ -1,75 +1,534 @@
 import os
 import re
 import json
+import time
+import asyncio
+import sqlite3
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+import numpy as np
 import google.generativeai as genai
-from .models import Inconsistency
+from google.api_core import exceptions as api_exceptions
+from .models import Inconsistency, SlideBatch
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Rate limiting (429) and server-side (5xx) failures are worth retrying
+RETRYABLE_ERRORS = (api_exceptions.TooManyRequests, api_exceptions.ResourceExhausted, api_exceptions.ServerError)
+
+# Markdown code fences (```json ... ```) and trailing commas before a closing
+# bracket, removed in one substitution pass
+_JSON_CLEANUP_RE = re.compile(r"^```[\w-]*[ \t]*\n?|^```[ \t]*$|,\s*(?=[}\]])", re.MULTILINE)
+
+# Words of four or more letters and numbers (optionally percentages); two
+# slides sharing none of these have nothing to contradict each other about
+_ENTITY_RE = re.compile(r"[A-Za-z]{4,}|\d+(?:\.\d+)?%?")
+
+# Layout json.dumps gives a stored verdict; most verdicts parse by slicing
+_VERDICT_FALSE = '{"consistent": false, "reason": "'
+_VERDICT_TRUE = '{"consistent": true, "reason": "'
+
+# Unit-norm embedding components are stored as int8 multiples of 1/127
+_QUANT_SCALE = 127.0
+
+def _quantize(embeddings):
+    return np.clip(np.rint(embeddings * _QUANT_SCALE), -127, 127).astype(np.int8)
+
+def _guard_hash(guard):
+    """64-bit hash of a semantic cache guard, comparable across runs."""
+    return int.from_bytes(hashlib.blake2b(guard.encode(), digest_size=8).digest(), "little", signed=True)
+
+BATCH_PROMPT_HEADER = (
+    "Compare the two slide texts in each numbered pair below for contradictions.\n"
+    "Respond ONLY with a valid JSON array holding one object per pair, in the format: "
+    '[{"id": int, "consistent": bool, "reason": str}]\n\n'
+)
+
+@dataclass
+class ProcessorConfig:
+    """Tuning knobs for how pair comparisons are dispatched to Gemini."""
+    batch_size: int = 20  # pairs per request
+    max_tokens_per_batch: int = 6000  # estimated prompt tokens per request
+    max_workers: int = 8  # requests in flight
+    max_retries: int = 3
+    backoff_factor: float = 1.0
+    candidate_top_k: int = 10  # nearest slides considered per slide
+    candidate_threshold: float = 0.6  # min embedding similarity for a candidate pair
+
+def _default_cache_dir():
+    return os.path.join(os.path.expanduser("~"), ".cache", "ppt_inspector", "pairs")
+
+class ExactCache:
+    """Verdicts keyed by the BLAKE2 digest of the exact prompt and the model version.
+
+    Recently used verdicts stay in an in-memory LRU; every verdict is also
+    written to a SQLite table so byte-identical prompts hit across runs,
+    while a model upgrade starts from an empty cache.
+    """
+
+    def __init__(self, cache_dir=None, maxsize=4096, model_version="gemini-2.5-flash"):
+        self.cache_dir = cache_dir or _default_cache_dir()
+        self.maxsize = maxsize
+        self.model_version = model_version
+        self._memory = OrderedDict()
+        self._db = None
+
+    def _connect(self):
+        if self._db is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._db = sqlite3.connect(os.path.join(self.cache_dir, "cache.db"))
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts "
+                "(key BLOB, model TEXT, val BLOB, created INTEGER, PRIMARY KEY (key, model))"
+            )
+        return self._db
+
+    def get(self, key):
+        verdict = self._memory.get(key)
+        if verdict is None:
+            row = self._connect().execute(
+                "SELECT val FROM verdicts WHERE key = ? AND model = ?",
+                (bytes.fromhex(key), self.model_version)
+            ).fetchone()
+            if row is None:
+                return None
+            verdict = row[0].decode("utf-8")
+            self._memory[key] = verdict
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+        return verdict
+
+    def set(self, key, verdict):
+        self._memory[key] = verdict
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+        self._connect().execute(
+            "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?)",
+            (bytes.fromhex(key), self.model_version, verdict.encode("utf-8"), int(time.time()))
+        )
+
+    def close(self):
+        """Commit the verdicts written since the last close, in one transaction."""
+        if self._db is not None:
+            self._db.commit()
+            self._db.close()
+            self._db = None
+
+class Embedder:
+    """Lazily loaded sentence-transformers model shared by every embedding user.
+
+    Loading the weights is the expensive part, so an analyzer holds one
+    instance and each encode is a single batched call. Needs the optional
+    sentence-transformers package; without it encode returns None.
+    """
+
+    def __init__(self, model_name="all-MiniLM-L6-v2", batch_size=64):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._model = None
+        self._enabled = True
+
+    def encode(self, texts):
+        """Return an (n, dim) float32 array of L2-normalized embeddings, or None."""
+        if self._model is None and self._enabled:
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._model = SentenceTransformer(self.model_name)
+            except ImportError:
+                self._enabled = False
+        if self._model is None or not texts:
+            return None
+        embeddings = self._model.encode(
+            texts, batch_size=self.batch_size, normalize_embeddings=True,
+            convert_to_numpy=True, show_progress_bar=False
+        )
+        return np.asarray(embeddings, dtype=np.float32)
+
+class SemanticCache:
+    """Reuses verdicts for slide pairs whose text embeds close to an already judged pair.
+
+    Embeddings are L2-normalized rows of one preallocated matrix, so a lookup
+    is a single inner-product scan. Rows are quantized to int8, a quarter of
+    the float32 size in memory and on disk; queries stay float32, which keeps
+    scores within about 0.01 of the exact ones. Once maxsize pairs are
+    stored the least recently used row is overwritten.
+
+    Each row also carries a guard, the numbers of both slides; a hit needs
+    an exactly equal guard, so pairs that differ only in a figure ("revenue
+    $2M" vs "revenue $5M") never share a verdict.
+    """
+
+    def __init__(self, cache_dir=None, threshold=0.87, maxsize=4096):
+        self.cache_dir = cache_dir or _default_cache_dir()
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._loaded = False
+        self._dirty = False
+        self._embeddings = None  # (maxsize, dim) int8, first _size rows in use
+        self._last_used = np.zeros(maxsize, dtype=np.int64)
+        self._guards = np.zeros(maxsize, dtype=np.int64)  # _guard_hash per row
+        self._entries = []  # (prompt_hash, verdict_json, guard) per row
+        self._size = 0
+        self._tick = 0
+
+    def _paths(self):
+        return os.path.join(self.cache_dir, "embeddings.npy"), os.path.join(self.cache_dir, "verdicts.jsonl")
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        embeddings_path, verdicts_path = self._paths()
+        if not (os.path.exists(embeddings_path) and os.path.exists(verdicts_path)):
+            return
+        try:
+            embeddings = np.load(embeddings_path)
+            with open(verdicts_path, encoding="utf-8") as f:
+                entries = [tuple(json.loads(line)) for line in f]
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not load semantic cache: {e}")
+            return
+        # Caches written before guards existed cannot be matched safely
+        if len(entries) != len(embeddings) or any(len(entry) != 3 for entry in entries):
+            return
+
+        # Rows are saved least recently used first; keep the most recent ones
+        embeddings, entries = embeddings[-self.maxsize:], entries[-self.maxsize:]
+        self._size = len(entries)
+        if embeddings.dtype != np.int8:
+            embeddings = _quantize(embeddings)
+        self._embeddings = np.empty((self.maxsize, embeddings.shape[1]), dtype=np.int8)
+        self._embeddings[:self._size] = embeddings
+        self._entries = entries
+        self._guards[:self._size] = [_guard_hash(entry[2]) for entry in entries]
+        self._last_used[:self._size] = np.arange(1, self._size + 1)
+        self._tick = self._size
+
+    def _touch(self, row):
+        self._tick += 1
+        self._last_used[row] = self._tick
+
+    def lookup(self, embedding, guard):
+        """Return the cached verdict for the nearest pair with this guard above the threshold, if any."""
+        if embedding is None:
+            return None
+        self._load()
+        if not self._size:
+            return None
+        scores = (self._embeddings[:self._size] @ embedding) / _QUANT_SCALE
+        scores[self._guards[:self._size] != _guard_hash(guard)] = -np.inf
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        self._touch(best)
+        return self._entries[best][1]
+
+    def add(self, embedding, prompt_hash, verdict, guard):
+        if embedding is None:
+            return
+        self._load()
+        if self._embeddings is None:
+            self._embeddings = np.empty((self.maxsize, embedding.shape[0]), dtype=np.int8)
+        if self._size < self.maxsize:
+            row = self._size
+            self._size += 1
+            self._entries.append((prompt_hash, verdict, guard))
+        else:
+            row = int(np.argmin(self._last_used))
+            self._entries[row] = (prompt_hash, verdict, guard)
+        self._embeddings[row] = _quantize(embedding)
+        self._guards[row] = _guard_hash(guard)
+        self._touch(row)
+        self._dirty = True
+
+    def save(self):
+        """Write the index to disk so later runs start warm."""
+        if not self._dirty:
+            return
+        order = np.argsort(self._last_used[:self._size])
+        embeddings_path, verdicts_path = self._paths()
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            np.save(embeddings_path, self._embeddings[order])
+            with open(verdicts_path, "w", encoding="utf-8") as f:
+                for row in order:
+                    f.write(json.dumps(self._entries[row]) + "\n")
+            self._dirty = False
+        except OSError as e:
+            print(f"⚠️ Could not save semantic cache: {e}")
 
 class AIAnalyzer:
-    def __init__(self):
+    def __init__(self, config=None, exact_cache=None, semantic_cache=None, embedder=None):
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("GEMINI_API_KEY not set in environment")
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        # All pair requests go through the async client; one gRPC channel
+        # multiplexes them over a single HTTP/2 connection
+        genai.configure(api_key=api_key, transport="grpc_asyncio")
+        self.model_name = "gemini-2.5-flash"
+        self.model = genai.GenerativeModel(self.model_name)
+        self.config = config if config is not None else ProcessorConfig()
+        self.exact_cache = exact_cache if exact_cache is not None else ExactCache(model_version=self.model_name)
+        self.semantic_cache = semantic_cache if semantic_cache is not None else SemanticCache()
+        self.embedder = embedder if embedder is not None else Embedder()
+        self._slide_embeddings = ((), None)  # (texts, embeddings) of the last deck
+        # The gRPC channel is bound to the event loop it was opened on, so
+        # every check runs on the same loop to keep reusing the connection
+        self._loop = None
 
     def _clean_json(self, text: str) -> str:
         """Clean Gemini output so it becomes valid JSON."""
-        # Remove triple backticks and language tags like ```json
-        if text.startswith("```"):
-            text = "\n".join(line for line in text.splitlines() if not line.startswith("```"))
+        text = _JSON_CLEANUP_RE.sub("", text)
 
         # Replace Python-style escapes with normal chars
-        text = text.replace("\\'", "'")
+        return text.replace("\\'", "'").strip()
 
-        # Remove trailing commas inside objects/arrays
-        text = re.sub(r",\s*([}\]])", r"\1", text)
+    def _parse_json(self, text: str):
+        """Parse Gemini output, cleaning it up only if it is not valid JSON as is."""
+        try:
+            return _json_loads(text)
+        except json.JSONDecodeError:
+            return _json_loads(self._clean_json(text))
 
-        return text.strip()
+    async def _generate(self, prompt):
+        """Call Gemini, retrying rate-limit and server errors with exponential backoff."""
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                response = await self.model.generate_content_async(prompt)
+                return response.text or ""
+            except RETRYABLE_ERRORS:
+                if attempt == self.config.max_retries:
+                    raise
+                await asyncio.sleep(self.config.backoff_factor * 2 ** attempt)
 
-    def check_consistency(self, slides):
-        inconsistencies = []
+    def _batches(self, pending):
+        """Group (pair, block) items by pair count and estimated prompt tokens."""
+        batch, tokens = [], 0
+        for item in pending:
+            cost = len(item[1]) // 4  # rough chars-per-token estimate
+            if batch and (len(batch) == self.config.batch_size or tokens + cost > self.config.max_tokens_per_batch):
+                yield batch
+                batch, tokens = [], 0
+            batch.append(item)
+            tokens += cost
+        if batch:
+            yield batch
+
+    async def _compare_batch(self, batch, semaphore):
+        """Ask Gemini about several pairs at once.
 
-        for i in range(len(slides)):
-            for j in range(i + 1, len(slides)):
-                prompt = (
-                    f"Compare the following slide texts for contradictions:\n"
-                    f"Slide {slides[i].slide_number}: {slides[i].text}\n"
-                    f"Slide {slides[j].slide_number}: {slides[j].text}\n"
-                    "Respond ONLY with valid JSON in the format: "
-                    '{"consistent": bool, "reason": str}'
+        Returns ({pair: verdict JSON}, parsed); when the response could not be
+        parsed every pair maps to the raw text and nothing should be cached.
+        """
+        prompt = BATCH_PROMPT_HEADER + "\n".join(
+            f"Pair {n}:\n{block}" for n, (_, block) in enumerate(batch, start=1)
+        )
+        async with semaphore:
+            raw_text = await self._generate(prompt)
+
+        try:
+            verdicts = self._parse_json(raw_text)
+            if not isinstance(verdicts, list):
+                raise ValueError("expected a JSON array")
+        except Exception as e:
+            print(f"⚠️ Could not parse LLM response as JSON: {raw_text}\nError: {e}")
+            return {pair: raw_text for pair, _ in batch}, False
+
+        results = {}
+        for verdict in verdicts:
+            try:
+                pair, _ = batch[int(verdict["id"]) - 1]
+            except (KeyError, TypeError, ValueError, IndexError):
+                continue
+            results[pair] = json.dumps({
+                "consistent": verdict.get("consistent", True),
+                "reason": verdict.get("reason", ""),
+            }, ensure_ascii=False)
+        return results, True
+
+    def _parse_verdict(self, text):
+        """Return (consistent, reason) from a {"consistent": bool, "reason": str} verdict.
+
+        Stored verdicts have a fixed layout, so a reason without escapes is
+        sliced out directly; anything else goes through the JSON parser.
+        """
+        if text.endswith('"}'):
+            if text.startswith(_VERDICT_FALSE):
+                consistent, reason = False, text[len(_VERDICT_FALSE):-2]
+            elif text.startswith(_VERDICT_TRUE):
+                consistent, reason = True, text[len(_VERDICT_TRUE):-2]
+            else:
+                reason = None
+            if reason is not None and "\\" not in reason and '"' not in reason:
+                return consistent, reason
+        verdict = self._parse_json(text)
+        return verdict.get("consistent", True), verdict.get("reason", "Possible contradiction")
+
+    def _to_inconsistency(self, batch, numbers, i, j, raw_text):
+        try:
+            consistent, reason = self._parse_verdict(raw_text)
+
+            if not consistent:
+                return Inconsistency(
+                    id=f"I{i}{j}",
+                    type="semantic_conflict",
+                    description=reason,
+                    slides=[numbers[i], numbers[j]],
+                    evidence=[batch.text_blocks[i], batch.text_blocks[j]],
+                    confidence=0.8
                 )
 
-                response = self.model.generate_content(prompt)
-                raw_text = response.text or ""
-
-                try:
-                    cleaned = self._clean_json(raw_text)
-                    verdict = json.loads(cleaned)
-
-                    if not verdict.get("consistent", True):
-                        inconsistencies.append(
-                            Inconsistency(
-                                id=f"I{i}{j}",
-                                type="semantic_conflict",
-                                description=verdict.get("reason", "Possible contradiction"),
-                                slides=[slides[i].slide_number, slides[j].slide_number],
-                                evidence=[slides[i].text, slides[j].text],
-                                confidence=0.8
-                            )
-                        )
-
-                except Exception as e:
-                    print(f"⚠️ Could not parse LLM response as JSON: {raw_text}\nError: {e}")
-                    # Fallback: store raw reason as an "unparsed" inconsistency
-                    inconsistencies.append(
-                        Inconsistency(
-                            id=f"I{i}{j}_raw",
-                            type="unparsed_llm_response",
-                            description=f"Raw LLM output: {raw_text}",
-                            slides=[slides[i].slide_number, slides[j].slide_number],
-                            evidence=[slides[i].text, slides[j].text],
-                            confidence=0.3
-                        )
-                    )
+        except Exception:
+            # Fallback: store raw reason as an "unparsed" inconsistency
+            return self._unparsed(batch, numbers, i, j, f"Raw LLM output: {raw_text}")
+
+        return None
 
+    def _unparsed(self, batch, numbers, i, j, description):
+        """A low-confidence entry for a pair without a usable verdict, so it is not mistaken for consistent."""
+        return Inconsistency(
+            id=f"I{i}{j}_raw",
+            type="unparsed_llm_response",
+            description=description,
+            slides=[numbers[i], numbers[j]],
+            evidence=[batch.text_blocks[i], batch.text_blocks[j]],
+            confidence=0.3
+        )
+
+    def _candidate_pairs(self, texts):
+        """Pairs of topically related slides, the only ones that can contradict.
+
+        Each slide is paired with its candidate_top_k nearest slides by
+        embedding similarity, above candidate_threshold. Without an embedder
+        every pair is a candidate.
+        """
+        n = len(texts)
+        if n < 2:
+            return []
+        # Re-checking the same deck reuses its slide embeddings
+        if self._slide_embeddings[0] != tuple(texts):
+            self._slide_embeddings = (tuple(texts), self.embedder.encode(texts))
+        embeddings = self._slide_embeddings[1]
+        if embeddings is None:
+            return [(i, j) for i in range(n) for j in range(i + 1, n)]
+
+        similarities = embeddings @ embeddings.T
+        np.fill_diagonal(similarities, -1.0)
+        k = min(self.config.candidate_top_k, n - 1)
+        neighbours = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+
+        # Threshold and emit pairs as whole-array operations; each pair is
+        # encoded as lo * n + hi so np.unique drops (i, j)/(j, i) duplicates
+        rows = np.repeat(np.arange(n), k)
+        cols = neighbours.ravel()
+        keep = similarities[rows, cols] > self.config.candidate_threshold
+        rows, cols = rows[keep], cols[keep]
+        codes = np.unique(np.minimum(rows, cols) * n + np.maximum(rows, cols))
+        return list(zip((codes // n).tolist(), (codes % n).tolist()))
+
+    async def _check_consistency_async(self, batch):
+        texts = batch.texts
+        numbers = batch.numbers.tolist()
+        entities = [frozenset(token.lower() for token in _ENTITY_RE.findall(text)) for text in texts]
+        # Every number on a slide, in order; semantic cache hits must match them exactly
+        numbers_in = [" ".join(token for token in _ENTITY_RE.findall(text) if token[0].isdigit()) for text in texts]
+        pairs = self._candidate_pairs(texts)
+        verdicts = {}
+        unchecked = {}  # pair -> why Gemini gave no verdict for it
+        misses = []
+        pending = []
+        embeddings = {}
+
+        # Identical pairs are answered from the exact cache without embedding
+        # anything; near-identical pairs (lightly edited decks) from the
+        # semantic cache; only the rest reach Gemini
+        for i, j in pairs:
+            # Duplicate slides (common in templates) cannot contradict each other
+            if texts[i] == texts[j]:
+                continue
+            # Lexical overlap only gates the request; it never marks a pair consistent
+            if entities[i].isdisjoint(entities[j]):
+                continue
+            block = f"Slide {numbers[i]}: {texts[i]}\nSlide {numbers[j]}: {texts[j]}"
+            key = hashlib.blake2b(block.encode()).hexdigest()
+            raw_text = self.exact_cache.get(key)
+            if raw_text is None:
+                misses.append(((i, j), block, key))
+            else:
+                verdicts[(i, j)] = raw_text
+
+        # A semantic hit is only an approximate answer, so it is used for this
+        # run but never written back to the exact cache
+        pair_embeddings = self.embedder.encode([f"{texts[i]}||{texts[j]}" for (i, j), _, _ in misses])
+        for n, ((i, j), block, key) in enumerate(misses):
+            embedding = pair_embeddings[n] if pair_embeddings is not None else None
+            guard = f"{numbers_in[i]}|{numbers_in[j]}"
+            raw_text = self.semantic_cache.lookup(embedding, guard)
+            if raw_text is None:
+                embeddings[(i, j)] = (embedding, key, guard)
+                pending.append(((i, j), block))
+            else:
+                verdicts[(i, j)] = raw_text
+
+        # Remaining pairs are packed several to a request, with at most
+        # max_workers requests in flight
+        semaphore = asyncio.Semaphore(self.config.max_workers)
+        batches = list(self._batches(pending))
+        results = await asyncio.gather(
+            *(self._compare_batch(pair_batch, semaphore) for pair_batch in batches),
+            return_exceptions=True
+        )
+        for pair_batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                print(f"⚠️ Gemini request failed for {len(pair_batch)} slide pairs: {result}")
+                for pair, _ in pair_batch:
+                    unchecked[pair] = f"Gemini request failed: {result}"
+                continue
+            batch_verdicts, parsed = result
+            for pair, raw_text in batch_verdicts.items():
+                if parsed:
+                    embedding, key, guard = embeddings[pair]
+                    self.semantic_cache.add(embedding, key, raw_text, guard)
+                    self.exact_cache.set(key, raw_text)
+                verdicts[pair] = raw_text
+            # A parsed reply can still skip some ids
+            for pair, _ in pair_batch:
+                if pair not in batch_verdicts:
+                    unchecked[pair] = "Gemini returned no verdict for this pair"
+
+        inconsistencies = []
+        for i, j in pairs:
+            if (i, j) in verdicts:
+                inconsistency = self._to_inconsistency(batch, numbers, i, j, verdicts[(i, j)])
+                if inconsistency is not None:
+                    inconsistencies.append(inconsistency)
+            elif (i, j) in unchecked:
+                inconsistencies.append(self._unparsed(batch, numbers, i, j, unchecked[(i, j)]))
+
+        self.exact_cache.close()
+        self.semantic_cache.save()
         return inconsistencies
+
+    def check_consistency(self, slides):
+        """Check a SlideBatch, or a list of SlideContent, for contradicting slides."""
+        batch = slides if isinstance(slides, SlideBatch) else SlideBatch.from_slides(slides)
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self._check_consistency_async(batch))
+
+    def close(self):
+        """Close the event loop, and with it the gRPC channel, kept between checks."""
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
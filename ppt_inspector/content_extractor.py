@@ -1,46 +1,73 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
-from .models import SlideContent
+from .models import SlideContent, SlideBatch
+
+def _write_blob(path, blob):
+    with open(path, "wb") as f:
+        f.write(blob)
 
 class ContentExtractor:
-    def __init__(self, temp_dir="tmp"):
+    def __init__(self, temp_dir="tmp", io_workers=8):
         self.temp_dir = temp_dir
         os.makedirs(temp_dir, exist_ok=True)
+        self.io_workers = io_workers
+
+    def _handle_text(self, shape, idx, slide_buffers, io_pool, writes):
+        if shape.has_text_frame:
+            slide_buffers[0].append(shape.text.strip())
+
+    def _handle_table(self, shape, idx, slide_buffers, io_pool, writes):
+        slide_buffers[1].append([
+            [cell.text.strip() for cell in row.cells]
+            for row in shape.table.rows
+        ])
+
+    def _handle_picture(self, shape, idx, slide_buffers, io_pool, writes):
+        images_content = slide_buffers[2]
+        image_path = os.path.join(self.temp_dir, f"slide_{idx}_{len(images_content)}.png")
+        writes.append(io_pool.submit(_write_blob, image_path, shape.image.blob))
+        images_content.append(image_path)
+
+    # One lookup per shape picks its handler; anything else may carry text
+    _handlers = {
+        MSO_SHAPE_TYPE.TABLE: _handle_table,
+        MSO_SHAPE_TYPE.PICTURE: _handle_picture,
+    }
 
     def extract(self, pptx_path: str):
         prs = Presentation(pptx_path)
         slides_data = []
+        writes = []
+        handlers = self._handlers
+        handle_text = ContentExtractor._handle_text
 
-        for idx, slide in enumerate(prs.slides, start=1):
-            text_content = []
-            tables_content = []
-            images_content = []
-
-            for shape in slide.shapes:
-                if shape.has_text_frame:
-                    text_content.append(shape.text.strip())
-
-                if shape.shape_type == MSO_SHAPE_TYPE.TABLE:
-                    table_data = [
-                        [cell.text.strip() for cell in row.cells]
-                        for row in shape.table.rows
-                    ]
-                    tables_content.append(table_data)
-
-                if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                    image_path = os.path.join(self.temp_dir, f"slide_{idx}_{len(images_content)}.png")
-                    with open(image_path, "wb") as f:
-                        f.write(shape.image.blob)
-                    images_content.append(image_path)
-
-            slides_data.append(
-                SlideContent(
-                    slide_number=idx,
-                    text=text_content,
-                    tables=tables_content,
-                    images=images_content
+        # Image files are written in the background while parsing continues;
+        # the pool lives for this call only and is joined on the way out
+        with ThreadPoolExecutor(max_workers=self.io_workers) as io_pool:
+            for idx, slide in enumerate(prs.slides, start=1):
+                # text, tables, images
+                slide_buffers = ([], [], [])
+
+                for shape in slide.shapes:
+                    handlers.get(shape.shape_type, handle_text)(self, shape, idx, slide_buffers, io_pool, writes)
+
+                slides_data.append(
+                    SlideContent(
+                        slide_number=idx,
+                        text=slide_buffers[0],
+                        tables=slide_buffers[1],
+                        images=slide_buffers[2]
+                    )
                 )
-            )
+
+            # Every image file exists (or its write error is raised) before returning
+            for write in writes:
+                write.result()
 
         return slides_data
+
+    def extract_batch(self, pptx_path: str):
+        """Extract a deck as a column-wise SlideBatch."""
+        return SlideBatch.from_slides(self.extract(pptx_path))
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from typing import List, Optional
+import numpy as np
 
 @dataclass
 class SlideContent:
@@ -8,6 +9,32 @@ class SlideContent:
     tables: List[List[List[str]]]
     images: List[str]  # paths to extracted images
 
+@dataclass
+class SlideBatch:
+    """A deck stored column-wise, one sequence per SlideContent field.
+
+    Whole-deck passes (embedding, hashing, pairing) iterate these directly
+    instead of dereferencing every SlideContent.
+    """
+    numbers: np.ndarray  # int32 slide numbers
+    texts: List[str]  # each slide's text blocks joined with spaces
+    text_blocks: List[List[str]]
+    table_refs: List[List[List[List[str]]]]
+    image_refs: List[List[str]]
+
+    def __len__(self):
+        return len(self.texts)
+
+    @classmethod
+    def from_slides(cls, slides):
+        return cls(
+            numbers=np.fromiter((s.slide_number for s in slides), dtype=np.int32, count=len(slides)),
+            texts=[" ".join(s.text) for s in slides],
+            text_blocks=[s.text for s in slides],
+            table_refs=[s.tables for s in slides],
+            image_refs=[s.images for s in slides],
+        )
+
 @dataclass
 class Inconsistency:
     id: str
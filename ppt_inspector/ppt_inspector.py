@@ -14,8 +14,11 @@ class PowerPointInspector:
         self.reporter = ReportGenerator()
 
     def analyze(self, pptx_path, output_file="report.json"):
-        slides = self.extractor.extract(pptx_path)
-        issues = self.analyzer.check_consistency(slides)
+        slides = self.extractor.extract_batch(pptx_path)
+        try:
+            issues = self.analyzer.check_consistency(slides)
+        finally:
+            self.analyzer.close()
         self.reporter.save(issues, output_file)
         print(f"Analysis complete. Found {len(issues)} issues. Report saved to {output_file}")
 
@@ -1,15 +1,27 @@
 import json
+from dataclasses import asdict
 from .models import Inconsistency
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
 class ReportGenerator:
     def __init__(self, output_format="json"):
         self.output_format = output_format
 
     def save(self, issues, output_file):
         if self.output_format == "json":
-            data = [issue.__dict__ for issue in issues]
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            # Stream one compact record per line instead of building and
+            # pretty-printing the whole list in memory
+            dumps = orjson.dumps if orjson is not None else lambda record: json.dumps(record).encode("utf-8")
+            with open(output_file, "wb") as f:
+                f.write(b"[")
+                for n, issue in enumerate(issues):
+                    f.write(b",\n" if n else b"\n")
+                    f.write(dumps(asdict(issue)))
+                f.write(b"\n]\n")
         else:
             with open(output_file, "w", encoding="utf-8") as f:
                 for issue in issues:
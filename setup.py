@@ -28,11 +28,10 @@ def read_requirements():
         return [
             "python-pptx>=0.6.21",
             "Pillow>=10.0.1",
-            "google-generativeai>=0.3.2",
+            "google-generativeai>=0.8.3",
             "python-dotenv>=1.0.0",
             "click>=8.1.7",
             "rich>=13.7.0",
-            "pandas>=2.1.4",
             "numpy>=1.24.3",
             "openpyxl>=3.1.2"
         ]
@@ -84,6 +83,10 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
         ],
+        "fast": [
+            "orjson>=3.8.0",
+            "numba>=0.57.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -48,7 +48,7 @@ def test_with_sample_slides():
         inspector.report_generator.generate_report(
             inconsistencies,
             output_format="json",
-            output_file="sample_analysis_report.json"
+            output="sample_analysis_report.json"
         )
         
         # Save CSV report
@@ -56,7 +56,7 @@ def test_with_sample_slides():
         inspector.report_generator.generate_report(
             inconsistencies,
             output_format="csv",
-            output_file="sample_analysis_report.csv"
+            output="sample_analysis_report.csv"
         )
         
         print(f"\n✅ Analysis complete! Found {len(inconsistencies)} inconsistencies.")